@@ -136,19 +136,18 @@ class YOLOv8:
 
         # Iterate over each row in the outputs array
         for i in range(rows):
-            # Extract the class scores from the current row
-            classes_scores = outputs[i][4:]
+            # Slice the current row once and extract the class scores from it
+            row = outputs[i]
+            classes_scores = row[4:]
 
-            # Find the maximum score among the class scores
-            max_score = np.amax(classes_scores)
+            # Find the class ID with the highest score and read its score, scanning the class scores only once
+            class_id = int(np.argmax(classes_scores))
+            max_score = classes_scores[class_id]
 
             # If the maximum score is above the confidence threshold
             if max_score >= self.confidence_thres:
-                # Get the class ID with the highest score
-                class_id = np.argmax(classes_scores)
-
                 # Extract the bounding box coordinates from the current row
-                x, y, w, h = outputs[i][0], outputs[i][1], outputs[i][2], outputs[i][3]
+                x, y, w, h = row[:4]
 
                 # Calculate the scaled coordinates of the bounding box
                 left = int((x - w / 2) * x_factor)
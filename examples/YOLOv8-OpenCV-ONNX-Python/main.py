@@ -1,6 +1,10 @@
 # Ultralytics YOLO 🚀, AGPL-3.0 license
 
 import argparse
+import contextlib
+import queue
+import threading
+from pathlib import Path
 
 import cv2.dnn
 import numpy as np
@@ -9,49 +13,128 @@ from ultralytics.utils import ASSETS, yaml_load
 from ultralytics.utils.checks import check_yaml
 
 CLASSES = yaml_load(check_yaml("coco8.yaml"))["names"]
-colors = np.random.uniform(0, 255, size=(len(CLASSES), 3))
+colors = [tuple(c) for c in np.random.randint(0, 256, size=(len(CLASSES), 3)).tolist()]  # integer BGR per class
 
 
-def draw_bounding_box(img, class_id, confidence, x, y, x_plus_w, y_plus_h):
+def draw_bounding_box(img, label, color, x, y, x_plus_w, y_plus_h):
     """
     Draws bounding boxes on the input image based on the provided arguments.
 
     Args:
         img (numpy.ndarray): The input image to draw the bounding box on.
-        class_id (int): Class ID of the detected object.
-        confidence (float): Confidence score of the detected object.
+        label (str): Label text of the detected object, i.e. 'person (0.89)'.
+        color (tuple): Integer BGR color of the bounding box and label.
         x (int): X-coordinate of the top-left corner of the bounding box.
         y (int): Y-coordinate of the top-left corner of the bounding box.
         x_plus_w (int): X-coordinate of the bottom-right corner of the bounding box.
         y_plus_h (int): Y-coordinate of the bottom-right corner of the bounding box.
     """
-    label = f"{CLASSES[class_id]} ({confidence:.2f})"
-    color = colors[class_id]
     cv2.rectangle(img, (x, y), (x_plus_w, y_plus_h), color, 2)
     cv2.putText(img, label, (x - 10, y - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2)
 
 
-def main(onnx_model, input_image):
+def nms(boxes, scores, iou_threshold):
     """
-    Main function to load ONNX model, perform inference, draw bounding boxes, and display the output image.
+    Performs non-maximum suppression with IoU computed against all remaining boxes at once in NumPy.
+
+    Args:
+        boxes (numpy.ndarray): Bounding boxes in (x, y, w, h) format with shape (N, 4).
+        scores (numpy.ndarray): Confidence scores with shape (N,).
+        iou_threshold (float): Boxes overlapping a kept box with an IoU above this threshold are suppressed.
+
+    Returns:
+        numpy.ndarray: Indices of the kept boxes, sorted by decreasing score.
+    """
+    x1, y1 = boxes[:, 0], boxes[:, 1]
+    x2, y2 = x1 + boxes[:, 2], y1 + boxes[:, 3]
+    areas = boxes[:, 2] * boxes[:, 3]
+    order = scores.argsort()[::-1]
+
+    keep = []
+    while order.size:
+        i, order = order[0], order[1:]
+        keep.append(int(i))
+        w = np.maximum(0.0, np.minimum(x2[i], x2[order]) - np.maximum(x1[i], x1[order]))
+        h = np.maximum(0.0, np.minimum(y2[i], y2[order]) - np.maximum(y1[i], y1[order]))
+        inter = w * h
+        order = order[inter / (areas[i] + areas[order] - inter + 1e-7) <= iou_threshold]
+    return np.array(keep, dtype=int)
+
+
+def load_model(onnx_model, backend="opencv"):
+    """
+    Loads an ONNX model with the requested backend and returns a function that runs inference on a blob.
 
     Args:
         onnx_model (str): Path to the ONNX model.
-        input_image (str): Path to the input image.
+        backend (str): Inference backend, either 'opencv' (OpenCV DNN) or 'onnxruntime' (TensorRT/CUDA/CPU providers).
 
     Returns:
-        list: List of dictionaries containing detection information such as class_id, class_name, confidence, etc.
+        (Callable): Function that takes a NCHW float32 blob and returns the raw model output.
     """
-    # Load the ONNX model
+    if backend == "onnxruntime":
+        import onnxruntime as ort
+
+        # Prefer TensorRT (FP16 with engines cached next to the model), then CUDA, then CPU, keeping available ones
+        trt_options = {
+            "trt_fp16_enable": True,
+            "trt_engine_cache_enable": True,
+            "trt_engine_cache_path": str(Path(onnx_model).resolve().parent),
+        }
+        providers = [("TensorrtExecutionProvider", trt_options), "CUDAExecutionProvider", "CPUExecutionProvider"]
+        available = ort.get_available_providers()
+        providers = [p for p in providers if (p[0] if isinstance(p, tuple) else p) in available]
+        session = ort.InferenceSession(onnx_model, providers=providers)
+        input_name, output_name = session.get_inputs()[0].name, session.get_outputs()[0].name
+        if session.get_providers()[0] == "CPUExecutionProvider":
+            return lambda blob: session.run(None, {input_name: blob})[0]
+
+        # On GPU bind a preallocated device input, updated in place for every blob of the same shape
+        binding = session.io_binding()
+        binding.bind_output(output_name, "cuda")
+        device_input = None
+
+        def forward(blob):
+            """Copies the blob into the bound device input and runs ONNX Runtime inference."""
+            nonlocal device_input
+            if device_input is None or tuple(device_input.shape()) != blob.shape:
+                device_input = ort.OrtValue.ortvalue_from_numpy(blob, "cuda", 0)
+                binding.bind_ortvalue_input(input_name, device_input)
+            else:
+                device_input.update_inplace(blob)
+            session.run_with_iobinding(binding)
+            return binding.copy_outputs_to_cpu()[0]
+
+        return forward
+
     model: cv2.dnn.Net = cv2.dnn.readNetFromONNX(onnx_model)
 
-    # Read the input image
-    original_image: np.ndarray = cv2.imread(input_image)
+    def forward(blob):
+        """Runs OpenCV DNN inference on the input blob."""
+        model.setInput(blob)
+        return model.forward()
+
+    return forward
+
+
+def preprocess(original_image, image=None):
+    """
+    Pads the image to a square and converts it into a blob for the model.
+
+    Args:
+        original_image (numpy.ndarray): The input BGR image.
+        image (numpy.ndarray, optional): Zero-initialized square uint8 buffer with side max(height, width), reused
+            across frames of the same size to avoid a new allocation per frame. Allocated here if None.
+
+    Returns:
+        tuple: The NCHW float32 blob and the scale factor from model input size back to the original image.
+    """
     [height, width, _] = original_image.shape
 
-    # Prepare a square image for inference
+    # Prepare a square image for inference, padding of a reused buffer stays zero for frames of the same size
     length = max((height, width))
-    image = np.zeros((length, length, 3), np.uint8)
+    if image is None:
+        image = np.zeros((length, length, 3), np.uint8)
     image[0:height, 0:width] = original_image
 
     # Calculate scale factor
@@ -59,60 +142,81 @@ def main(onnx_model, input_image):
 
     # Preprocess the image and prepare blob for model
     blob = cv2.dnn.blobFromImage(image, scalefactor=1 / 255, size=(640, 640), swapRB=True)
-    model.setInput(blob)
-
-    # Perform inference
-    outputs = model.forward()
-
-    # Prepare output array
-    outputs = np.array([cv2.transpose(outputs[0])])
-    rows = outputs.shape[1]
-
-    boxes = []
-    scores = []
-    class_ids = []
-
-    # Iterate through output to collect bounding boxes, confidence scores, and class IDs
-    for i in range(rows):
-        classes_scores = outputs[0][i][4:]
-        (minScore, maxScore, minClassLoc, (x, maxClassIndex)) = cv2.minMaxLoc(classes_scores)
-        if maxScore >= 0.25:
-            box = [
-                outputs[0][i][0] - (0.5 * outputs[0][i][2]),
-                outputs[0][i][1] - (0.5 * outputs[0][i][3]),
-                outputs[0][i][2],
-                outputs[0][i][3],
-            ]
-            boxes.append(box)
-            scores.append(maxScore)
-            class_ids.append(maxClassIndex)
+    return blob, scale
+
+
+def postprocess(outputs, scale, original_image):
+    """
+    Filters the raw model output, applies NMS, and draws the resulting detections on the original image.
+
+    Args:
+        outputs (numpy.ndarray): Raw model output with shape (1, 84, 8400).
+        scale (float): Scale factor from model input size back to the original image.
+        original_image (numpy.ndarray): The image to draw the detections on.
+
+    Returns:
+        list: List of dictionaries containing detection information such as class_id, class_name, confidence, etc.
+    """
+    # Prepare output array as a (8400, 84) transposed view, no copy
+    pred = outputs[0].T
+    rows = pred.shape[0]
+
+    # Collect bounding boxes, confidence scores, and class IDs in a single vectorized pass
+    classes_scores = pred[:, 4:]
+    class_ids = np.argmax(classes_scores, axis=1)
+    scores = classes_scores[np.arange(rows), class_ids]
+    keep = scores >= 0.25
+    pred, scores, class_ids = pred[keep], scores[keep], class_ids[keep]
+    boxes = np.concatenate([pred[:, :2] - 0.5 * pred[:, 2:4], pred[:, 2:4]], axis=1)
 
     # Apply NMS (Non-maximum suppression)
-    result_boxes = cv2.dnn.NMSBoxes(boxes, scores, 0.25, 0.45, 0.5)
+    result_boxes = nms(boxes, scores, 0.45)
+    boxes, scores, class_ids = boxes[result_boxes], scores[result_boxes].tolist(), class_ids[result_boxes]
+
+    # Prepare labels, colors and pixel corners for all kept boxes at once
+    class_ids = class_ids.tolist()
+    labels = [f"{CLASSES[c]} ({s:.2f})" for c, s in zip(class_ids, scores)]
+    box_colors = [colors[c] for c in class_ids]
+    corners = np.round(np.concatenate([boxes[:, :2], boxes[:, :2] + boxes[:, 2:]], axis=1) * scale).astype(int)
 
     detections = []
 
     # Iterate through NMS results to draw bounding boxes and labels
-    for i in range(len(result_boxes)):
-        index = result_boxes[i]
-        box = boxes[index]
+    for i, class_id in enumerate(class_ids):
         detection = {
-            "class_id": class_ids[index],
-            "class_name": CLASSES[class_ids[index]],
-            "confidence": scores[index],
-            "box": box,
+            "class_id": class_id,
+            "class_name": CLASSES[class_id],
+            "confidence": scores[i],
+            "box": boxes[i].tolist(),
             "scale": scale,
         }
         detections.append(detection)
-        draw_bounding_box(
-            original_image,
-            class_ids[index],
-            scores[index],
-            round(box[0] * scale),
-            round(box[1] * scale),
-            round((box[0] + box[2]) * scale),
-            round((box[1] + box[3]) * scale),
-        )
+        draw_bounding_box(original_image, labels[i], box_colors[i], *corners[i].tolist())
+
+    return detections
+
+
+def main(onnx_model, input_image, backend="opencv"):
+    """
+    Main function to load ONNX model, perform inference, draw bounding boxes, and display the output image.
+
+    Args:
+        onnx_model (str): Path to the ONNX model.
+        input_image (str): Path to the input image.
+        backend (str): Inference backend, either 'opencv' or 'onnxruntime'.
+
+    Returns:
+        list: List of dictionaries containing detection information such as class_id, class_name, confidence, etc.
+    """
+    # Load the ONNX model
+    model = load_model(onnx_model, backend)
+
+    # Read and preprocess the input image
+    original_image: np.ndarray = cv2.imread(input_image)
+    blob, scale = preprocess(original_image)
+
+    # Perform inference and draw the detections
+    detections = postprocess(model(blob), scale, original_image)
 
     # Display the image with bounding boxes
     cv2.imshow("image", original_image)
@@ -122,9 +226,87 @@ def main(onnx_model, input_image):
     return detections
 
 
+def main_video(onnx_model, source, backend="opencv", buffer_size=2):
+    """
+    Runs inference on a video file, camera or stream, reading and preprocessing frames in a producer thread.
+
+    Frames are passed through a bounded queue so decoding and preprocessing overlap with inference. When inference
+    falls behind, the oldest queued frame is dropped, like a camera buffer, to keep the displayed output current.
+    Press 'q' to stop.
+
+    Args:
+        onnx_model (str): Path to the ONNX model.
+        source (str): Path to a video file, a stream URL, or a camera index.
+        backend (str): Inference backend, either 'opencv' or 'onnxruntime'.
+        buffer_size (int): Maximum number of preprocessed frames waiting for inference.
+    """
+    model = load_model(onnx_model, backend)
+    cap = cv2.VideoCapture(int(source) if source.isnumeric() else source)
+    if not cap.isOpened():
+        raise ConnectionError(f"Failed to open video source {source}")
+    frames = queue.Queue(maxsize=buffer_size)
+    running = threading.Event()
+    running.set()
+    errors = []  # exception raised in the producer thread, re-raised on the main thread
+
+    def put(item):
+        """Puts an item in the queue, dropping the oldest frame while the queue is full."""
+        while running.is_set():
+            try:
+                frames.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                with contextlib.suppress(queue.Empty):
+                    frames.get_nowait()
+
+    def produce():
+        """Reads and preprocesses frames until the source is exhausted, fails, or the consumer stops."""
+        try:
+            image, shape = None, None
+            while running.is_set():
+                success, frame = cap.read()
+                if not success:
+                    break
+                if frame.shape != shape:  # allocate the square buffer once per frame size
+                    shape = frame.shape
+                    length = max(shape[:2])
+                    image = np.zeros((length, length, 3), np.uint8)
+                put((frame, *preprocess(frame, image)))
+        except Exception as e:
+            errors.append(e)
+        finally:
+            put(None)  # end of stream, always sent so the consumer never blocks forever
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+
+    try:
+        while (item := frames.get()) is not None:
+            frame, blob, scale = item
+            postprocess(model(blob), scale, frame)
+            cv2.imshow("video", frame)
+            if cv2.waitKey(1) & 0xFF == ord("q"):
+                break
+    finally:
+        running.clear()
+        producer.join()
+        cap.release()
+        cv2.destroyAllWindows()
+
+    if errors:
+        raise errors[0]
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--model", default="yolov8n.onnx", help="Input your ONNX model.")
     parser.add_argument("--img", default=str(ASSETS / "bus.jpg"), help="Path to input image.")
+    parser.add_argument("--video", default=None, help="Path to a video file, stream URL or camera index.")
+    parser.add_argument(
+        "--backend", default="opencv", choices=["opencv", "onnxruntime"], help="Inference backend to run the model."
+    )
     args = parser.parse_args()
-    main(args.model, args.img)
+    if args.video is not None:
+        main_video(args.model, args.video, args.backend)
+    else:
+        main(args.model, args.img, args.backend)
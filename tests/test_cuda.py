@@ -48,6 +48,16 @@ def test_export_engine_matrix(task, dynamic, int8, half, batch):
     Path(file).with_suffix(".cache").unlink() if int8 else None  # cleanup INT8 cache
 
 
+@pytest.mark.slow
+@pytest.mark.skipif(not CUDA_IS_AVAILABLE, reason="CUDA is not available")
+def test_classify_engine_partial_batch():
+    """Test a static batch-2 classification TensorRT engine on a source that leaves a partial final batch."""
+    file = YOLO(TASK2MODEL["classify"]).export(format="engine", imgsz=32, batch=2, workspace=1)
+    results = YOLO(file)([SOURCE] * 3, imgsz=32, batch=2)  # batches of 2 and 1, the last one zero-padded
+    assert len(results) == 3
+    Path(file).unlink()  # cleanup
+
+
 @pytest.mark.skipif(not CUDA_IS_AVAILABLE, reason="CUDA is not available")
 def test_train():
     """Test model training on a minimal dataset."""
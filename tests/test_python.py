@@ -299,16 +299,26 @@ def test_data_converter():
 
 
 def test_data_annotator():
-    """Test automatic data annotation."""
+    """Test automatic data annotation with batched detection."""
     from ultralytics.data.annotator import auto_annotate
 
+    output_dir = TMP / "auto_annotate_labels"
     auto_annotate(
         ASSETS,
         det_model=WEIGHTS_DIR / "yolov8n.pt",
         sam_model=WEIGHTS_DIR / "mobile_sam.pt",
-        output_dir=TMP / "auto_annotate_labels",
+        output_dir=output_dir,
+        batch=2,
     )
 
+    # Each labelled image gets one line per detection, with the detected classes, for the batched results
+    for r in YOLO(WEIGHTS_DIR / "yolov8n.pt")(ASSETS, batch=2):
+        f = output_dir / f"{Path(r.path).stem}.txt"
+        if not len(r.boxes):
+            continue
+        classes = [int(line.split()[0]) for line in f.read_text().splitlines()]
+        assert sorted(classes) == sorted(r.boxes.cls.int().tolist()), f"label mismatch for {f.name}"
+
 
 def test_events():
     """Test event sending functionality."""
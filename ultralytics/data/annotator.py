@@ -1,11 +1,14 @@
 # Ultralytics YOLO 🚀, AGPL-3.0 license
 
+from collections import deque
+from multiprocessing.pool import ThreadPool
 from pathlib import Path
 
 from ultralytics import SAM, YOLO
+from ultralytics.utils import NUM_THREADS
 
 
-def auto_annotate(data, det_model="yolov8x.pt", sam_model="sam_b.pt", device="", output_dir=None):
+def auto_annotate(data, det_model="yolov8x.pt", sam_model="sam_b.pt", device="", output_dir=None, batch=1):
     """
     Automatically annotates images using a YOLO object detection model and a SAM segmentation model.
 
@@ -16,6 +19,8 @@ def auto_annotate(data, det_model="yolov8x.pt", sam_model="sam_b.pt", device="",
         device (str, optional): Device to run the models on. Defaults to an empty string (CPU or GPU, if available).
         output_dir (str | None | optional): Directory to save the annotated results.
             Defaults to a 'labels' folder in the same directory as 'data'.
+        batch (int, optional): Number of images per detection model forward pass. Defaults to 1.
+            TensorRT engines must be exported with a matching batch size, i.e. format='engine', dynamic=True, batch=8.
 
     Example:
         ```python
@@ -32,19 +37,33 @@ def auto_annotate(data, det_model="yolov8x.pt", sam_model="sam_b.pt", device="",
         output_dir = data.parent / f"{data.stem}_auto_annotate_labels"
     Path(output_dir).mkdir(exist_ok=True, parents=True)
 
-    det_results = det_model(data, stream=True, device=device)
-
-    for result in det_results:
-        class_ids = result.boxes.cls.int().tolist()  # noqa
-        if len(class_ids):
-            boxes = result.boxes.xyxy  # Boxes object for bbox outputs
-            sam_results = sam_model(result.orig_img, bboxes=boxes, verbose=False, save=False, device=device)
-            segments = sam_results[0].masks.xyn  # noqa
-
-            with open(f"{Path(output_dir) / Path(result.path).stem}.txt", "w") as f:
-                for i in range(len(segments)):
-                    s = segments[i]
-                    if len(s) == 0:
-                        continue
-                    segment = map(str, segments[i].reshape(-1).tolist())
-                    f.write(f"{class_ids[i]} " + " ".join(segment) + "\n")
+    det_results = det_model(data, stream=True, device=device, batch=batch)
+
+    with ThreadPool(NUM_THREADS) as pool:  # write label files in the background while the models run
+        writes = deque()  # pending label file writes
+        try:
+            for result in det_results:
+                if len(result.boxes):
+                    boxes = result.boxes.xyxy  # Boxes object for bbox outputs, kept on device for SAM prompts
+                    sam_results = sam_model(result.orig_img, bboxes=boxes, verbose=False, save=False, device=device)
+                    segments = sam_results[0].masks.xyn  # noqa
+                    class_ids = result.boxes.cls.int().tolist()  # noqa
+
+                    lines = []
+                    for i, s in enumerate(segments):
+                        if len(s) == 0:
+                            continue
+                        line = (class_ids[i], *s.reshape(-1).tolist())
+                        lines.append(("%g " * len(line)).rstrip() % line + "\n")
+
+                    f = Path(output_dir) / f"{Path(result.path).stem}.txt"
+                    writes.append(pool.apply_async(f.write_text, ("".join(lines),)))
+
+                # Collect finished writes as they complete, raising errors early and bounding pending writes
+                while writes and (writes[0].ready() or len(writes) > 2 * NUM_THREADS):
+                    writes.popleft().get()
+        finally:
+            for w in writes:
+                w.wait()  # finish queued label files before the pool is terminated, also if inference failed
+        for w in writes:
+            w.get()  # raise any remaining write errors
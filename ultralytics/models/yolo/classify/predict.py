@@ -1,12 +1,14 @@
 # Ultralytics YOLO 🚀, AGPL-3.0 license
 
 import cv2
+import numpy as np
 import torch
 from PIL import Image
 
 from ultralytics.engine.predictor import BasePredictor
 from ultralytics.engine.results import Results
 from ultralytics.utils import DEFAULT_CFG, ops
+from ultralytics.utils.torch_utils import TORCHVISION_0_13
 
 
 class ClassificationPredictor(BasePredictor):
@@ -15,6 +17,13 @@ class ClassificationPredictor(BasePredictor):
 
     Notes:
         - Torchvision classification models can also be passed to the 'model' argument, i.e. model='resnet18'.
+        - For batched TensorRT inference export with a dynamic batch dimension, i.e.
+          model.export(format='engine', dynamic=True, batch=8, half=True), and predict with a matching 'batch' argument.
+          Partial batches on static-shape engines are zero-padded up to the exported batch size.
+        - Lists of same-shape images (including single images) are preprocessed as one batch with antialiased
+          torchvision tensor resizing, while mixed-shape batches and validation (ClassificationDataset) resize with
+          PIL. The two resize kernels differ by a few pixel levels, so predict logits can differ slightly from val
+          and for the same image predicted alongside differently sized images.
 
     Example:
         ```python
@@ -32,6 +41,9 @@ class ClassificationPredictor(BasePredictor):
         super().__init__(cfg, overrides, _callbacks)
         self.args.task = "classify"
         self._legacy_transform_name = "ultralytics.yolo.data.augment.ToTensor"
+        self._pinned = None  # reusable pinned host buffer for asynchronous host to device copies
+        self._pinned_copy = None  # CUDA event marking completion of the last copy from the pinned buffer
+        self._normalize = None  # cached (Normalize transform, scale, mean, std) with mean/std on device
 
     def preprocess(self, img):
         """Converts input image to model-compatible data type."""
@@ -41,6 +53,8 @@ class ClassificationPredictor(BasePredictor):
             )
             if is_legacy_transform:  # to handle legacy transforms
                 img = torch.stack([self.transforms(im) for im in img], dim=0)
+            elif self._is_batchable(img):  # same-shape images and tensor-compatible transforms
+                img = self.batch_transform(img)
             else:
                 img = torch.stack(
                     [self.transforms(Image.fromarray(cv2.cvtColor(im, cv2.COLOR_BGR2RGB))) for im in img], dim=0
@@ -48,6 +62,84 @@ class ClassificationPredictor(BasePredictor):
         img = (img if isinstance(img, torch.Tensor) else torch.from_numpy(img)).to(self.model.device)
         return img.half() if self.model.fp16 else img.float()  # uint8 to fp16/32
 
+    def _is_batchable(self, img):
+        """Checks if images share a shape and all transforms can be applied to a batched tensor."""
+        import torchvision.transforms as T  # scope for faster 'import ultralytics'
+
+        batchable = (T.Resize, T.CenterCrop, T.ToTensor, T.Normalize)
+        return (
+            TORCHVISION_0_13  # antialiased tensor resize to match PIL, older versions use the PIL path
+            and isinstance(self.transforms, T.Compose)
+            and all(isinstance(t, batchable) for t in self.transforms.transforms)
+            and all(isinstance(im, np.ndarray) and im.ndim == 3 and im.shape == img[0].shape for im in img)
+        )
+
+    def batch_transform(self, img):
+        """
+        Applies classification transforms to a list of same-shape images as a single batch.
+
+        Resize and crop run on the host on uint8 data, rounded like PIL, so only the transformed uint8 batch is copied
+        to the model device, where it is cast to the model dtype and normalized.
+
+        Args:
+            img (List[np.ndarray]): [(HWC) x B] list of BGR uint8 images with identical shapes.
+
+        Returns:
+            (torch.Tensor): Transformed BCHW tensor on the model device, FP16 for FP16 models on CUDA else FP32.
+        """
+        import torchvision.transforms as T  # scope for faster 'import ultralytics'
+        import torchvision.transforms.functional as F
+
+        im = np.stack(img)[..., ::-1].transpose((0, 3, 1, 2))  # BGR to RGB, BHWC to BCHW, (n, 3, h, w)
+        im = torch.from_numpy(np.ascontiguousarray(im))
+        for t in self.transforms.transforms:  # geometric transforms on host, uint8 in and out
+            if isinstance(t, T.Resize):  # antialias explicitly, tensor Resize defaults to no antialias before 0.17
+                antialias = t.interpolation in {T.InterpolationMode.BILINEAR, T.InterpolationMode.BICUBIC}
+                im = F.resize(im, t.size, t.interpolation, t.max_size, antialias=antialias)
+            elif isinstance(t, T.CenterCrop):
+                im = t(im)
+
+        if self.model.device.type == "cuda":  # copy through a reused pinned buffer of the transformed shape
+            if self._pinned is None or self._pinned.shape != im.shape:
+                self._pinned = torch.empty(im.shape, dtype=torch.uint8).pin_memory()
+            elif self._pinned_copy is not None:
+                self._pinned_copy.synchronize()  # previous copy out of the buffer must finish before overwriting
+            self._pinned.copy_(im)
+            im = self._pinned.to(self.model.device, non_blocking=True)
+            self._pinned_copy = torch.cuda.Event()
+            self._pinned_copy.record(torch.cuda.current_stream(self.model.device))  # stream running the copy
+            im = im.half() if self.model.fp16 else im.float()
+        else:
+            im = im.float()
+
+        scale = 1.0  # pending ToTensor 0-255 to 0.0-1.0 scaling, folded into Normalize when present
+        for t in self.transforms.transforms:  # pixel transforms on device, they commute with resize and crop
+            if isinstance(t, T.ToTensor):
+                scale = 255.0
+            elif isinstance(t, T.Normalize):
+                mean, std = self._normalize_stats(t, scale, im.dtype, im.device)
+                im.sub_(mean).div_(std)
+                scale = 1.0
+        return im.div_(scale) if scale != 1.0 else im
+
+    def _normalize_stats(self, t, scale, dtype, device):
+        """Returns scaled mean and std tensors of a Normalize transform on device, cached across batches."""
+        cached = self._normalize
+        if cached is None or cached[0] is not t or cached[1] != scale or cached[2].dtype != dtype:
+            mean = torch.as_tensor(t.mean, dtype=torch.float32).view(-1, 1, 1) * scale
+            std = torch.as_tensor(t.std, dtype=torch.float32).view(-1, 1, 1) * scale
+            self._normalize = cached = (t, scale, mean.to(device, dtype), std.to(device, dtype))
+        return cached[2], cached[3]
+
+    def inference(self, im, *args, **kwargs):
+        """Runs inference, padding partial batches up to the batch size of static-shape TensorRT engines."""
+        n = im.shape[0]
+        if self.model.engine and not self.model.dynamic and n < self.model.batch_size:
+            im = torch.cat((im, im.new_zeros((self.model.batch_size - n, *im.shape[1:]))))
+            preds = super().inference(im, *args, **kwargs)
+            return preds[:n] if isinstance(preds, torch.Tensor) else [p[:n] for p in preds]
+        return super().inference(im, *args, **kwargs)
+
     def postprocess(self, preds, img, orig_imgs):
         """Post-processes predictions to return Results objects."""
         if not isinstance(orig_imgs, list):  # input images are a torch.Tensor, not a list